@@ -4,53 +4,30 @@ Statistical Analysis of Impassable Gate Puzzle Solver Results
 Analyzes test results from output/ directory
 """
 
-import os
-import re
+import sys
 from collections import defaultdict
-import statistics
-
-def parse_result_file(filepath):
-    """Parse a single result file and extract metrics"""
-    data = {}
-    try:
-        with open(filepath, 'r') as f:
-            content = f.read()
-
-        # Extract metrics using regex
-        data['solution_path'] = re.search(r'Solution path: (.+)', content)
-        data['solution_path'] = data['solution_path'].group(1) if data['solution_path'] else None
-
-        data['execution_time'] = float(re.search(r'Execution time: ([\d.]+)', content).group(1))
-        data['expanded_nodes'] = int(re.search(r'Expanded nodes: (\d+)', content).group(1))
-        data['generated_nodes'] = int(re.search(r'Generated nodes: (\d+)', content).group(1))
-        data['duplicated_nodes'] = int(re.search(r'Duplicated nodes: (\d+)', content).group(1))
-        data['memory_usage'] = int(re.search(r'Auxiliary memory usage \(bytes\): (\d+)', content).group(1))
-        data['num_pieces'] = int(re.search(r'Number of pieces in the puzzle: (\d+)', content).group(1))
-        data['solution_steps'] = int(re.search(r'Number of steps in solution: (\d+)', content).group(1))
-        data['empty_spaces'] = int(re.search(r'Number of empty spaces: (\d+)', content).group(1))
-
-        solved_by = re.search(r'Solved by IW\((\d+)\)', content)
-        data['solved_by_iw'] = int(solved_by.group(1)) if solved_by else None
-
-        nodes_per_sec = re.search(r'Number of nodes expanded per second: ([\d.]+)', content)
-        data['nodes_per_second'] = float(nodes_per_sec.group(1)) if nodes_per_sec else None
-
-        return data
-    except Exception as e:
-        print(f"Error parsing {filepath}: {e}")
-        return None
+import numpy as np
+from pathlib import Path
+from parsing import parse_output_files
+
+# Fields every successful run reports; the rest are optional
+_REQUIRED = ('execution_time', 'expanded_nodes', 'generated_nodes',
+             'duplicated_nodes', 'memory_usage', 'num_pieces',
+             'solution_steps', 'empty_spaces')
 
 def calculate_stats(values):
     """Calculate statistics for a list of values"""
     if not values:
         return {}
+    # One conversion, then C-level reductions over the array
+    arr = np.asarray(values)
     return {
-        'min': min(values),
-        'max': max(values),
-        'mean': statistics.mean(values),
-        'median': statistics.median(values),
-        'stdev': statistics.stdev(values) if len(values) > 1 else 0,
-        'total': sum(values)
+        'min': arr.min(),
+        'max': arr.max(),
+        'mean': arr.mean(),
+        'median': np.median(arr),
+        'stdev': arr.std(ddof=1) if arr.size > 1 else 0,
+        'total': arr.sum()
     }
 
 def main():
@@ -59,40 +36,46 @@ def main():
     # Group results by algorithm
     results = defaultdict(list)
 
-    # Parse all result files
-    for filename in os.listdir(output_dir):
-        if filename.endswith('.txt'):
-            filepath = os.path.join(output_dir, filename)
-
-            # Extract algorithm name
-            if filename.startswith('algo1_'):
-                algo = 'Algorithm 1'
-            elif filename.startswith('algo2_'):
-                algo = 'Algorithm 2'
-            elif filename.startswith('algo3_'):
-                algo = 'Algorithm 3'
-            else:
-                continue
-
-            data = parse_result_file(filepath)
-            if data:
-                results[algo].append({
-                    'filename': filename,
-                    'data': data
-                })
-
-    # Generate summary report
-    print("=" * 80)
-    print("STATISTICAL SUMMARY OF IMPASSABLE GATE PUZZLE SOLVER RESULTS")
-    print("=" * 80)
-    print()
+    # Collect result files and their algorithm names; the glob already
+    # filters by algorithm, so no per-file name checks are needed
+    algo_files = []
+    for algo_num in [1, 2, 3]:
+        algo = f'Algorithm {algo_num}'
+        for filepath in Path(output_dir).glob(f'algo{algo_num}_*.txt'):
+            algo_files.append((algo, filepath.name, filepath))
+
+    parsed = parse_output_files([filepath for _, _, filepath in algo_files])
+
+    for (algo, filename, filepath), data in zip(algo_files, parsed):
+        # Unreadable files were already reported by the parser
+        if data is None:
+            continue
+
+        missing = [key for key in _REQUIRED if data[key] is None]
+        if missing:
+            print(f"Error parsing {filepath}: missing {', '.join(missing)}")
+            continue
+
+        results[algo].append({
+            'filename': filename,
+            'data': data
+        })
+
+    # Generate summary report, buffered and written in one go
+    lines = []
+    out = lines.append
+
+    out("=" * 80)
+    out("STATISTICAL SUMMARY OF IMPASSABLE GATE PUZZLE SOLVER RESULTS")
+    out("=" * 80)
+    out('')
 
     for algo in sorted(results.keys()):
-        print(f"\n{'=' * 80}")
-        print(f"{algo}")
-        print(f"{'=' * 80}")
-        print(f"Total test cases: {len(results[algo])}")
-        print()
+        out(f"\n{'=' * 80}")
+        out(f"{algo}")
+        out(f"{'=' * 80}")
+        out(f"Total test cases: {len(results[algo])}")
+        out('')
 
         # Collect metrics
         metrics = {
@@ -104,7 +87,7 @@ def main():
             'num_pieces': [],
             'solution_steps': [],
             'empty_spaces': [],
-            'nodes_per_second': []
+            'nodes_per_sec': []
         }
 
         solved_by_iw = defaultdict(int)
@@ -115,98 +98,98 @@ def main():
                 if data.get(key) is not None:
                     metrics[key].append(data[key])
 
-            if data.get('solved_by_iw') is not None:
-                solved_by_iw[data['solved_by_iw']] += 1
+            if data.get('iw_width') is not None:
+                solved_by_iw[data['iw_width']] += 1
 
         # Print statistics for each metric
-        print("EXECUTION TIME (seconds):")
+        out("EXECUTION TIME (seconds):")
         stats = calculate_stats(metrics['execution_time'])
-        print(f"  Min:    {stats['min']:.6f}")
-        print(f"  Max:    {stats['max']:.6f}")
-        print(f"  Mean:   {stats['mean']:.6f}")
-        print(f"  Median: {stats['median']:.6f}")
-        print(f"  StdDev: {stats['stdev']:.6f}")
-        print(f"  Total:  {stats['total']:.6f}")
-        print()
-
-        print("EXPANDED NODES:")
+        out(f"  Min:    {stats['min']:.6f}")
+        out(f"  Max:    {stats['max']:.6f}")
+        out(f"  Mean:   {stats['mean']:.6f}")
+        out(f"  Median: {stats['median']:.6f}")
+        out(f"  StdDev: {stats['stdev']:.6f}")
+        out(f"  Total:  {stats['total']:.6f}")
+        out('')
+
+        out("EXPANDED NODES:")
         stats = calculate_stats(metrics['expanded_nodes'])
-        print(f"  Min:    {stats['min']:,}")
-        print(f"  Max:    {stats['max']:,}")
-        print(f"  Mean:   {stats['mean']:,.2f}")
-        print(f"  Median: {stats['median']:,.0f}")
-        print(f"  StdDev: {stats['stdev']:,.2f}")
-        print(f"  Total:  {stats['total']:,}")
-        print()
-
-        print("GENERATED NODES:")
+        out(f"  Min:    {stats['min']:,}")
+        out(f"  Max:    {stats['max']:,}")
+        out(f"  Mean:   {stats['mean']:,.2f}")
+        out(f"  Median: {stats['median']:,.0f}")
+        out(f"  StdDev: {stats['stdev']:,.2f}")
+        out(f"  Total:  {stats['total']:,}")
+        out('')
+
+        out("GENERATED NODES:")
         stats = calculate_stats(metrics['generated_nodes'])
-        print(f"  Min:    {stats['min']:,}")
-        print(f"  Max:    {stats['max']:,}")
-        print(f"  Mean:   {stats['mean']:,.2f}")
-        print(f"  Median: {stats['median']:,.0f}")
-        print(f"  StdDev: {stats['stdev']:,.2f}")
-        print(f"  Total:  {stats['total']:,}")
-        print()
-
-        print("DUPLICATED NODES:")
+        out(f"  Min:    {stats['min']:,}")
+        out(f"  Max:    {stats['max']:,}")
+        out(f"  Mean:   {stats['mean']:,.2f}")
+        out(f"  Median: {stats['median']:,.0f}")
+        out(f"  StdDev: {stats['stdev']:,.2f}")
+        out(f"  Total:  {stats['total']:,}")
+        out('')
+
+        out("DUPLICATED NODES:")
         stats = calculate_stats(metrics['duplicated_nodes'])
-        print(f"  Min:    {stats['min']:,}")
-        print(f"  Max:    {stats['max']:,}")
-        print(f"  Mean:   {stats['mean']:,.2f}")
-        print(f"  Median: {stats['median']:,.0f}")
-        print(f"  StdDev: {stats['stdev']:,.2f}")
-        print(f"  Total:  {stats['total']:,}")
-        print()
-
-        print("AUXILIARY MEMORY USAGE (bytes):")
+        out(f"  Min:    {stats['min']:,}")
+        out(f"  Max:    {stats['max']:,}")
+        out(f"  Mean:   {stats['mean']:,.2f}")
+        out(f"  Median: {stats['median']:,.0f}")
+        out(f"  StdDev: {stats['stdev']:,.2f}")
+        out(f"  Total:  {stats['total']:,}")
+        out('')
+
+        out("AUXILIARY MEMORY USAGE (bytes):")
         stats = calculate_stats(metrics['memory_usage'])
-        print(f"  Min:    {stats['min']:,}")
-        print(f"  Max:    {stats['max']:,}")
-        print(f"  Mean:   {stats['mean']:,.2f}")
-        print(f"  Median: {stats['median']:,.0f}")
-        print(f"  StdDev: {stats['stdev']:,.2f}")
-        print(f"  Total:  {stats['total']:,} ({stats['total']/1024:.2f} KB)")
-        print()
-
-        print("SOLUTION STEPS:")
+        out(f"  Min:    {stats['min']:,}")
+        out(f"  Max:    {stats['max']:,}")
+        out(f"  Mean:   {stats['mean']:,.2f}")
+        out(f"  Median: {stats['median']:,.0f}")
+        out(f"  StdDev: {stats['stdev']:,.2f}")
+        out(f"  Total:  {stats['total']:,} ({stats['total']/1024:.2f} KB)")
+        out('')
+
+        out("SOLUTION STEPS:")
         stats = calculate_stats(metrics['solution_steps'])
-        print(f"  Min:    {stats['min']}")
-        print(f"  Max:    {stats['max']}")
-        print(f"  Mean:   {stats['mean']:.2f}")
-        print(f"  Median: {stats['median']:.0f}")
-        print(f"  StdDev: {stats['stdev']:.2f}")
-        print()
-
-        print("NODES EXPANDED PER SECOND:")
-        if metrics['nodes_per_second']:
-            stats = calculate_stats(metrics['nodes_per_second'])
-            print(f"  Min:    {stats['min']:,.2f}")
-            print(f"  Max:    {stats['max']:,.2f}")
-            print(f"  Mean:   {stats['mean']:,.2f}")
-            print(f"  Median: {stats['median']:,.2f}")
-            print(f"  StdDev: {stats['stdev']:,.2f}")
+        out(f"  Min:    {stats['min']}")
+        out(f"  Max:    {stats['max']}")
+        out(f"  Mean:   {stats['mean']:.2f}")
+        out(f"  Median: {stats['median']:.0f}")
+        out(f"  StdDev: {stats['stdev']:.2f}")
+        out('')
+
+        out("NODES EXPANDED PER SECOND:")
+        if metrics['nodes_per_sec']:
+            stats = calculate_stats(metrics['nodes_per_sec'])
+            out(f"  Min:    {stats['min']:,.2f}")
+            out(f"  Max:    {stats['max']:,.2f}")
+            out(f"  Mean:   {stats['mean']:,.2f}")
+            out(f"  Median: {stats['median']:,.2f}")
+            out(f"  StdDev: {stats['stdev']:,.2f}")
         else:
-            print("  No data available")
-        print()
+            out("  No data available")
+        out('')
 
-        print("SOLVED BY IW WIDTH:")
+        out("SOLVED BY IW WIDTH:")
         for width in sorted(solved_by_iw.keys()):
             count = solved_by_iw[width]
             percentage = (count / len(results[algo])) * 100
-            print(f"  IW({width}): {count} puzzles ({percentage:.1f}%)")
-        print()
+            out(f"  IW({width}): {count} puzzles ({percentage:.1f}%)")
+        out('')
 
     # Cross-algorithm comparison
-    print(f"\n{'=' * 80}")
-    print("CROSS-ALGORITHM COMPARISON")
-    print(f"{'=' * 80}")
-    print()
+    out(f"\n{'=' * 80}")
+    out("CROSS-ALGORITHM COMPARISON")
+    out(f"{'=' * 80}")
+    out('')
 
     comparison_metrics = ['execution_time', 'expanded_nodes', 'memory_usage']
 
     for metric in comparison_metrics:
-        print(f"{metric.upper().replace('_', ' ')}:")
+        out(f"{metric.upper().replace('_', ' ')}:")
         for algo in sorted(results.keys()):
             values = []
             for result in results[algo]:
@@ -214,16 +197,17 @@ def main():
                     values.append(result['data'][metric])
 
             if values:
-                mean_val = statistics.mean(values)
+                mean_val = np.mean(values)
                 if metric == 'execution_time':
-                    print(f"  {algo}: {mean_val:.6f} seconds (mean)")
+                    out(f"  {algo}: {mean_val:.6f} seconds (mean)")
                 elif metric == 'memory_usage':
-                    print(f"  {algo}: {mean_val:,.2f} bytes (mean)")
+                    out(f"  {algo}: {mean_val:,.2f} bytes (mean)")
                 else:
-                    print(f"  {algo}: {mean_val:,.2f} (mean)")
-        print()
+                    out(f"  {algo}: {mean_val:,.2f} (mean)")
+        out('')
 
-    print("=" * 80)
+    out("=" * 80)
+    sys.stdout.write('\n'.join(lines) + '\n')
 
 if __name__ == "__main__":
     main()
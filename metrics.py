@@ -0,0 +1,19 @@
+#!/usr/bin/env python3
+"""
+Theoretical Metric Helpers for Impassable Gate AI Algorithms
+
+Shared by space_performance.py and time_complexity.py, which model the
+solvers' theoretical space and time from the parsed output columns.
+"""
+
+import numpy as np
+
+def capped_pow(base, exponent, cap):
+    """Elementwise min(base ** exponent, cap) without overflowing.
+
+    exponent * log(base) is compared against log(cap) first, so powers that
+    would exceed the cap are never evaluated.
+    """
+    with np.errstate(divide='ignore', invalid='ignore'):
+        over = exponent * np.log(base) > np.log(cap)
+    return np.where(over, cap, np.minimum(base ** np.where(over, 0, exponent), cap))
@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+"""
+Output File Parser for Impassable Gate AI Algorithms
+
+Shared by analyze_results.py, space_performance.py and time_complexity.py.
+Parses the solver's output/algo*_*.txt files into metric dicts, caching
+the results on disk so unchanged files are not parsed again, and turns
+those dicts into per-algorithm NumPy columns for the plotting scripts.
+"""
+
+import os
+import pickle
+import tempfile
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+# Parsed output files, keyed by (path, mtime, size) so edits invalidate them
+CACHE_PATH = Path.home() / '.cache' / 'ads_a3' / 'parsed.pkl'
+
+# Bump whenever parse_output_file's results change, so stale caches are dropped
+CACHE_VERSION = 2
+
+# Below this many stale files, starting worker processes costs more than it saves
+POOL_THRESHOLD = 256
+
+# Metric fields: (line prefix, key, converter for the rest of the line,
+# column dtype). Files are scanned as raw bytes; int() and float() accept
+# bytes directly.
+FIELDS = [
+    (b'Solution path: ', 'solution_path', bytes.decode, object),
+    (b'Execution time: ', 'execution_time', float, np.float64),
+    (b'Expanded nodes: ', 'expanded_nodes', int, np.int64),
+    (b'Generated nodes: ', 'generated_nodes', int, np.int64),
+    (b'Duplicated nodes: ', 'duplicated_nodes', int, np.int64),
+    (b'Auxiliary memory usage (bytes): ', 'memory_usage', int, np.int64),
+    (b'Number of pieces in the puzzle: ', 'num_pieces', int, np.int64),
+    (b'Number of steps in solution: ', 'solution_steps', int, np.int64),
+    (b'Number of empty spaces: ', 'empty_spaces', int, np.int64),
+    (b'Solved by IW(', 'iw_width', lambda value: int(value.rstrip(b')')), np.int64),
+    (b'Number of nodes expanded per second: ', 'nodes_per_sec', float, np.float64),
+]
+
+def parse_output_file(filepath):
+    """Parse an algorithm output file and extract metrics (None if absent or malformed)."""
+    data = dict.fromkeys(key for _, key, _, _ in FIELDS)
+    remaining = len(FIELDS)
+
+    with open(filepath, 'rb') as f:
+        for line in f:
+            for prefix, key, convert, _ in FIELDS:
+                if line.startswith(prefix):
+                    # Keep the first occurrence of each field
+                    if data[key] is None:
+                        try:
+                            data[key] = convert(line[len(prefix):].rstrip())
+                            remaining -= 1
+                        except (ValueError, UnicodeDecodeError):
+                            # Empty or non-numeric values count as absent
+                            pass
+                    break
+
+            # Every field found: skip whatever follows the metrics block
+            if not remaining:
+                break
+
+    return data
+
+def _load_cache():
+    """Load the parsed-file cache, or start empty if it is missing, unreadable
+    or was written by a different CACHE_VERSION."""
+    try:
+        with open(CACHE_PATH, 'rb') as f:
+            cache = pickle.load(f)
+    except (OSError, EOFError, pickle.UnpicklingError):
+        return {}
+    if not isinstance(cache, dict) or cache.get('version') != CACHE_VERSION:
+        return {}
+    return cache['entries']
+
+def _save_cache(entries):
+    """Write the parsed-file cache to a temp file and swap it into place."""
+    try:
+        CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=CACHE_PATH.parent, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                pickle.dump({'version': CACHE_VERSION, 'entries': entries}, f,
+                            protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, CACHE_PATH)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+    except OSError as e:
+        print(f"Warning: could not write cache {CACHE_PATH}: {e}")
+
+def _cache_key(filepath):
+    """Cache key that changes whenever the file is rewritten (None if it cannot be stat'ed)."""
+    try:
+        st = os.stat(filepath)
+    except OSError:
+        return None
+    return (os.path.abspath(filepath), st.st_mtime_ns, st.st_size)
+
+def _parse_or_report(filepath):
+    """Parse one output file, reporting it and returning None if it cannot be read."""
+    try:
+        return parse_output_file(filepath)
+    except OSError as e:
+        print(f"Error parsing {filepath}: {e}")
+        return None
+
+def parse_output_files(filepaths):
+    """Parse several output files, returning one fresh metrics dict per path.
+
+    Only files that changed since the last run are parsed, in parallel when
+    there are enough of them to pay for the worker processes. Files that
+    cannot be read are reported and come back as None.
+    """
+    cache = _load_cache()
+    keys = [_cache_key(filepath) for filepath in filepaths]
+    results = [cache.get(key) for key in keys]
+    stale = [i for i, key in enumerate(keys) if key not in cache]
+    stale_paths = [filepaths[i] for i in stale]
+
+    if len(stale) >= POOL_THRESHOLD:
+        # Files are independent, so parse them across all cores
+        with ProcessPoolExecutor() as executor:
+            parsed = list(executor.map(_parse_or_report, stale_paths,
+                                       chunksize=32))
+    else:
+        parsed = [_parse_or_report(filepath) for filepath in stale_paths]
+
+    for i, data in zip(stale, parsed):
+        results[i] = data
+        # Unreadable files are not cached, so they are retried next run
+        if data is not None and keys[i] is not None:
+            cache[keys[i]] = data
+
+    if stale:
+        _save_cache({key: cache[key] for key in keys if key in cache})
+
+    # Copies, so callers can annotate records without touching the cache
+    return [None if data is None else dict(data) for data in results]
+
+def _column(records, key, dtype=np.float64):
+    """Gather one field of every record into an array (missing values become 0)."""
+    if dtype is object:
+        return np.array([d[key] for d in records], dtype=object)
+    return np.fromiter((d[key] or 0 for d in records), dtype=dtype,
+                       count=len(records))
+
+def to_columns(records):
+    """Convert a list of per-file records into a dict of column arrays."""
+    columns = {key: _column(records, key, dtype) for _, key, _, dtype in FIELDS}
+    columns['algorithm'] = np.array([d['algorithm'] for d in records], dtype=str)
+    columns['puzzle_name'] = np.array([d['puzzle_name'] for d in records], dtype=str)
+    return columns
+
+def group_by_algorithm(all_data):
+    """Split the columns into one column dict per algorithm."""
+    by_algo = {}
+    for algo_name in ['algo1', 'algo2', 'algo3']:
+        mask = all_data['algorithm'] == algo_name
+        by_algo[algo_name] = {key: values[mask] for key, values in all_data.items()}
+    return by_algo
@@ -12,135 +12,99 @@ Theoretical worst-case metrics considered:
 3. Combined: pieces * steps * empty_spaces * IW_width
 """
 
-import os
-import re
 import matplotlib.pyplot as plt
 import numpy as np
 from pathlib import Path
-
-def parse_output_file(filepath):
-    """Parse an algorithm output file and extract metrics."""
-    with open(filepath, 'r') as f:
-        content = f.read()
-
-    data = {}
-
-    # Extract metrics using regex
-    patterns = {
-        'solution_path': r'Solution path: (.+)',
-        'execution_time': r'Execution time: ([\d.]+)',
-        'expanded_nodes': r'Expanded nodes: (\d+)',
-        'generated_nodes': r'Generated nodes: (\d+)',
-        'duplicated_nodes': r'Duplicated nodes: (\d+)',
-        'memory_usage': r'Auxiliary memory usage \(bytes\): (\d+)',
-        'num_pieces': r'Number of pieces in the puzzle: (\d+)',
-        'solution_steps': r'Number of steps in solution: (\d+)',
-        'empty_spaces': r'Number of empty spaces: (\d+)',
-        'iw_width': r'Solved by IW\((\d+)\)',
-        'nodes_per_sec': r'Number of nodes expanded per second: ([\d.]+)'
-    }
-
-    for key, pattern in patterns.items():
-        match = re.search(pattern, content)
-        if match:
-            value = match.group(1)
-            # Convert to appropriate type
-            if key == 'solution_path':
-                data[key] = value
-            elif key in ['execution_time', 'nodes_per_sec']:
-                data[key] = float(value)
-            else:
-                data[key] = int(value)
-        else:
-            data[key] = None
-
-    return data
-
-def compute_theoretical_metrics(data):
-    """Compute various theoretical worst-case performance metrics."""
-    pieces = data['num_pieces']
-    steps = data['solution_steps']
-    empty = data['empty_spaces']
-    width = data['iw_width']
-
-    metrics = {}
+from metrics import capped_pow
+from parsing import group_by_algorithm, parse_output_files, to_columns
+
+def compute_theoretical_metrics(all_data):
+    """Compute various theoretical worst-case performance metrics.
+
+    Each metric is added to all_data as a float column; rows where its
+    inputs are missing hold 0.
+    """
+    pieces = all_data['num_pieces'].astype(np.float64)
+    steps = all_data['solution_steps'].astype(np.float64)
+    empty = all_data['empty_spaces'].astype(np.float64)
+    width = all_data['iw_width'].astype(np.float64)
+
+    # A zero input already makes each product 0, so only the powers need
+    # masking (x ** 0 == 1)
+    has_pieces = pieces > 0
+    has_empty = empty > 0
+    has_width = width > 0
 
     # Metric 1: State space size (simplified: empty_spaces ^ pieces)
     # This represents the theoretical maximum number of states
-    if empty and pieces:
-        metrics['state_space'] = min(empty ** pieces, 1e15)  # Cap at 1e15 to avoid overflow
+    state_space = capped_pow(empty, pieces, 1e15)  # Cap at 1e15 to avoid overflow
+    all_data['state_space'] = np.where(has_empty & has_pieces, state_space, 0.0)
 
     # Metric 2: Search depth * branching factor
     # Branching factor ≈ pieces * 4 (4 directions)
-    if steps and pieces:
-        branching = pieces * 4
-        metrics['depth_branching'] = steps * branching
+    all_data['depth_branching'] = steps * (pieces * 4)
 
     # Metric 3: IW complexity proxy: pieces * empty_spaces * width
-    if pieces and empty and width:
-        metrics['iw_complexity'] = pieces * empty * width
+    iw_complexity = pieces * empty * width
+    all_data['iw_complexity'] = iw_complexity
 
     # Metric 4: Combined metric
-    if pieces and steps and empty and width:
-        metrics['combined'] = pieces * steps * empty * width
+    all_data['combined'] = iw_complexity * steps
 
     # Metric 5: Exponential in width: empty^width (simplified state space for IW)
-    if empty and width:
-        metrics['exponential_width'] = min(empty ** width, 1e15)  # Cap to avoid overflow
-
-    return metrics
+    exponential_width = capped_pow(empty, width, 1e15)  # Cap to avoid overflow
+    all_data['exponential_width'] = np.where(has_empty & has_width, exponential_width, 0.0)
 
 def collect_all_data(output_dir='output'):
-    """Collect data from all output files."""
-    all_data = []
+    """Collect data from all output files into a dict of column arrays."""
+    records = []
 
     output_path = Path(output_dir)
+    algo_files = []
     for algo_num in [1, 2, 3]:
         pattern = f'algo{algo_num}_*.txt'
         for filepath in output_path.glob(pattern):
-            data = parse_output_file(filepath)
-            if data['generated_nodes'] is not None:
-                data['algorithm'] = f'algo{algo_num}'
-                data['puzzle_name'] = filepath.stem.replace(f'algo{algo_num}_', '')
-                data['theoretical'] = compute_theoretical_metrics(data)
-                all_data.append(data)
+            algo_files.append((f'algo{algo_num}', filepath))
+
+    parsed = parse_output_files([filepath for _, filepath in algo_files])
+
+    for (algo_name, filepath), data in zip(algo_files, parsed):
+        if data is not None and data['generated_nodes'] is not None:
+            data['algorithm'] = algo_name
+            data['puzzle_name'] = filepath.stem.replace(f'{algo_name}_', '')
+            records.append(data)
+
+    all_data = to_columns(records)
+    compute_theoretical_metrics(all_data)
 
     return all_data
 
-def create_plots(all_data):
+def create_plots(by_algo):
     """Create visualization plots."""
 
-    # Separate data by algorithm
-    algo1_data = [d for d in all_data if d['algorithm'] == 'algo1']
-    algo2_data = [d for d in all_data if d['algorithm'] == 'algo2']
-    algo3_data = [d for d in all_data if d['algorithm'] == 'algo3']
-
     # Define the 3 theoretical metrics to plot
     theoretical_metrics = [
-        ('iw_complexity', 'Pieces × Empty Spaces × IW Width', 'metric1'),
-        ('combined', 'Pieces × Steps × Empty Spaces × IW Width', 'metric2'),
-        ('exponential_width', 'Empty Spaces ^ IW Width', 'metric3')
+        ('iw_complexity', 'Pieces × Empty Spaces × IW Width'),
+        ('combined', 'Pieces × Steps × Empty Spaces × IW Width'),
+        ('exponential_width', 'Empty Spaces ^ IW Width')
     ]
 
-    # Create separate figure for each theoretical metric
-    for metric_key, metric_label, metric_name in theoretical_metrics:
-        fig, ax = plt.subplots(1, 1, figsize=(10, 8))
+    # One panel per theoretical metric, rendered and encoded in a single savefig
+    fig, axes = plt.subplots(1, 3, figsize=(30, 8))
 
+    for ax, (metric_key, metric_label) in zip(axes, theoretical_metrics):
         # Plot all three algorithms on the same graph
         for algo_data, color, algo_name, marker in [
-            (algo1_data, 'red', 'Algorithm 1 (No Dup Detection)', 'o'),
-            (algo2_data, 'blue', 'Algorithm 2 (Radix Tree)', 's'),
-            (algo3_data, 'green', 'Algorithm 3 (Iterative Width)', '^')
+            (by_algo['algo1'], 'red', 'Algorithm 1 (No Dup Detection)', 'o'),
+            (by_algo['algo2'], 'blue', 'Algorithm 2 (Radix Tree)', 's'),
+            (by_algo['algo3'], 'green', 'Algorithm 3 (Iterative Width)', '^')
         ]:
-            x_vals = []
-            y_vals = []
+            # Skip puzzles the metric is undefined for
+            mask = algo_data[metric_key] != 0
+            x_vals = algo_data[metric_key][mask]
+            y_vals = algo_data['generated_nodes'][mask]
 
-            for d in algo_data:
-                if metric_key in d['theoretical'] and d['theoretical'][metric_key]:
-                    x_vals.append(d['theoretical'][metric_key])
-                    y_vals.append(d['generated_nodes'])
-
-            if x_vals:
+            if x_vals.size:
                 ax.scatter(x_vals, y_vals, alpha=0.7, s=150,
                           color=color, label=algo_name, marker=marker,
                           edgecolors='black', linewidth=1)
@@ -153,42 +117,43 @@ def create_plots(all_data):
         ax.set_xscale('log')
         ax.set_yscale('log')
 
-        plt.tight_layout()
+    plt.tight_layout()
 
-        # Save with metric-specific filename
-        filename = f'performance_{metric_name}.png'
-        plt.savefig(filename, dpi=300, bbox_inches='tight')
-        print(f"Saved {filename}")
-        plt.close()
+    filename = 'performance_all_metrics.png'
+    plt.savefig(filename, dpi=300, bbox_inches='tight')
+    print(f"Saved {filename}")
+    plt.close()
 
-def print_statistics(all_data):
+def print_statistics(by_algo):
     """Print summary statistics."""
     print("\n" + "="*80)
     print("PERFORMANCE ANALYSIS SUMMARY")
     print("="*80)
 
     for algo_name in ['algo1', 'algo2', 'algo3']:
-        algo_data = [d for d in all_data if d['algorithm'] == algo_name]
-        if not algo_data:
+        algo_data = by_algo[algo_name]
+        if not algo_data['algorithm'].size:
             continue
 
         print(f"\n{algo_name.upper()}:")
-        print(f"  Total puzzles: {len(algo_data)}")
+        print(f"  Total puzzles: {algo_data['algorithm'].size}")
 
-        generated = [d['generated_nodes'] for d in algo_data]
-        expanded = [d['expanded_nodes'] for d in algo_data]
-        duplicates = [d['duplicated_nodes'] for d in algo_data]
-        exec_time = [d['execution_time'] for d in algo_data]
+        generated = algo_data['generated_nodes']
+        expanded = algo_data['expanded_nodes']
+        duplicates = algo_data['duplicated_nodes']
+        exec_time = algo_data['execution_time']
 
-        print(f"  Generated nodes: min={min(generated):,}, max={max(generated):,}, avg={np.mean(generated):,.0f}")
-        print(f"  Expanded nodes:  min={min(expanded):,}, max={max(expanded):,}, avg={np.mean(expanded):,.0f}")
-        print(f"  Duplicated nodes: min={min(duplicates):,}, max={max(duplicates):,}, avg={np.mean(duplicates):,.0f}")
-        print(f"  Execution time (s): min={min(exec_time):.6f}, max={max(exec_time):.2f}, avg={np.mean(exec_time):.3f}")
+        print(f"  Generated nodes: min={generated.min():,}, max={generated.max():,}, avg={generated.mean():,.0f}")
+        print(f"  Expanded nodes:  min={expanded.min():,}, max={expanded.max():,}, avg={expanded.mean():,.0f}")
+        print(f"  Duplicated nodes: min={duplicates.min():,}, max={duplicates.max():,}, avg={duplicates.mean():,.0f}")
+        print(f"  Execution time (s): min={exec_time.min():.6f}, max={exec_time.max():.2f}, avg={exec_time.mean():.3f}")
 
         if algo_name in ['algo2', 'algo3']:
-            total_attempted = [g + d for g, d in zip(generated, duplicates)]
-            efficiency = [g / t * 100 if t > 0 else 0 for g, t in zip(generated, total_attempted)]
-            print(f"  Efficiency %: min={min(efficiency):.1f}%, max={max(efficiency):.1f}%, avg={np.mean(efficiency):.1f}%")
+            total_attempted = generated + duplicates
+            with np.errstate(divide='ignore', invalid='ignore'):
+                efficiency = np.where(total_attempted > 0,
+                                      generated / total_attempted * 100, 0.0)
+            print(f"  Efficiency %: min={efficiency.min():.1f}%, max={efficiency.max():.1f}%, avg={efficiency.mean():.1f}%")
 
 if __name__ == '__main__':
     print("Analyzing algorithm performance...")
@@ -196,21 +161,22 @@ if __name__ == '__main__':
     # Collect all data
     all_data = collect_all_data('output')
 
-    if not all_data:
+    if not all_data['algorithm'].size:
         print("Error: No output files found in 'output/' directory")
         exit(1)
 
-    print(f"Loaded {len(all_data)} puzzle results")
+    print(f"Loaded {all_data['algorithm'].size} puzzle results")
+
+    # Group once; every report below works per algorithm
+    by_algo = group_by_algorithm(all_data)
 
     # Print statistics
-    print_statistics(all_data)
+    print_statistics(by_algo)
 
     # Create plots
     print("\nGenerating plots...")
-    create_plots(all_data)
+    create_plots(by_algo)
 
     print("\nAnalysis complete!")
     print("Generated files:")
-    print("  - performance_metric1.png (Pieces × Empty Spaces × IW Width)")
-    print("  - performance_metric2.png (Pieces × Steps × Empty Spaces × IW Width)")
-    print("  - performance_metric3.png (Empty Spaces ^ IW Width)")
+    print("  - performance_all_metrics.png (one panel per theoretical metric)")